@@ -1,7 +1,9 @@
 import pygame
 import random
-import time
+import array
+import bisect
 import sys
+import types
 
 
 # PYGAME INITIALIZATION
@@ -56,6 +58,14 @@ HIGH_CONTRAST_THEME = {
     'button': (128, 128, 128), # Gray buttons
     'button_hover': (200, 200, 200) # Light gray hover
 }
+# All themes in cycle order, indexed by theme_mode (0=Light, 1=Dark, 2=High Contrast)
+# Every color is converted to pygame.Color once here, so draw and fill calls
+# take it directly instead of parsing a tuple on every call.
+# Each theme is a read-only mapping: current_theme is bound to one of these
+# directly (never copied), so writing through it would change the theme itself
+THEMES = tuple(types.MappingProxyType({name: pygame.Color(color) for name, color in theme.items()})
+               for theme in (LIGHT_THEME, DARK_THEME, HIGH_CONTRAST_THEME))
+LIGHT_THEME, DARK_THEME, HIGH_CONTRAST_THEME = THEMES
 
 # Game Configuration Constants
 MEMORIZATION_TIME = 10.0  # Base seconds to memorize grid (adjusted by difficulty)
@@ -63,9 +73,13 @@ TILE_SIZE_STANDARD = 75 # Standard tile width and height in pixels
 TILE_SIZE_LARGE = 110 # Large tile size for accessibility
 TILE_SIZE_EXTRA_LARGE = 150 # Extra large tile size for accessibility
 TILE_GAP = 10 # Space between tiles in pixels
-ANIMATION_SPEED = 6 # Transparency change per frame for fade effects
+SCREEN_FADE_IN_DURATION = 500 # Milliseconds for the startup fade-in from black
+GRID_FADE_IN_DURATION = 700 # Milliseconds for the grid to fade in at round start
+GRID_FADE_OUT_DURATION = 250 # Milliseconds for numbers to fade out after memorizing
 CLICK_DURATION = 300 # Milliseconds to show click feedback on tiles
-FADE_DURATION = 800 # Milliseconds for fade transitions between rounds
+FEEDBACK_DURATION = 2000 # Milliseconds the round feedback screen stays up
+MENU_IDLE_WAIT = 50 # Longest a static menu sleeps before re-checking hover
+TEXT_CACHE_LIMIT = 256 # Most rendered strings text_cache holds at once
 
 # Font Initialization
 # Try to load Montserrat from file, fallback to system font if file not found
@@ -74,6 +88,36 @@ FONT_LARGE = pygame.font.Font("Montserrat-Regular.ttf", 17) # Tile numbers
 FONT_MEDIUM = pygame.font.Font("Montserrat-Regular.ttf", 17) # Section headers
 FONT_SMALL = pygame.font.Font("Montserrat-Regular.ttf", 17) # Instructions
 FONT_TINY = pygame.font.Font("Montserrat-Regular.ttf", 10) # Footer text
+try:
+    FONT_TILE_LARGE = pygame.font.Font("Montserrat-Regular.ttf", 42) # Large tile numbers
+except:
+    FONT_TILE_LARGE = pygame.font.SysFont("montserrat", 42)
+try:
+    FONT_TILE_EXTRA_LARGE = pygame.font.Font("Montserrat-Regular.ttf", 48) # Extra large tile numbers
+except:
+    FONT_TILE_EXTRA_LARGE = pygame.font.SysFont("montserrat", 48)
+
+# Tile number font for each tile size
+TILE_FONTS = {
+    TILE_SIZE_STANDARD: FONT_LARGE,
+    TILE_SIZE_LARGE: FONT_TILE_LARGE,
+    TILE_SIZE_EXTRA_LARGE: FONT_TILE_EXTRA_LARGE
+}
+
+# Pre-rendered Tile Numbers
+# The largest grid is 5×5, so tiles never show a number above 25
+MAX_TILE_NUMBER = 25
+# glyph_cache[(number, font, color)] is that number rendered in that font and color
+# Filled in by get_number_glyph() the first time a glyph is needed; the standard
+# tile font is rasterized for every theme at startup so standard tiles never
+# call font.render in a round
+# (pygame.Color is unhashable, so the key holds the color as an RGBA tuple)
+glyph_cache = {
+    (number, FONT_LARGE, tuple(theme['text_primary'])):
+        FONT_LARGE.render(str(number), True, theme['text_primary'])
+    for theme in THEMES
+    for number in range(1, MAX_TILE_NUMBER + 1)
+}
 
 # Display Window Creation
 # Create the main game window with specified dimensions
@@ -82,11 +126,32 @@ display = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 # Set the window title shown in the title bar
 pygame.display.set_caption("MonkeyTrain - Memory Training Game")
 
+# Full-window black overlay used by the screen fades
+# Created and filled once in the display's pixel format so alpha blits of it
+# stay on SDL's fast path; the fades only change its alpha
+fade_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+fade_overlay.fill((0, 0, 0))
+
+# Frame Timing
+# One Clock shared by every loop that paces itself with tick(), instead of
+# each screen and round allocating its own
+frame_clock = pygame.time.Clock()
+
+# Event Filtering
+# The only event types the game reacts to; every other type (MOUSEMOTION,
+# window focus, text input, audio device events...) is blocked so it never
+# enters the queue. Hover checks read pygame.mouse.get_pos(), which pygame
+# keeps current even while MOUSEMOTION events are blocked.
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE)
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(HANDLED_EVENTS)
+
 
 # Variables that track the current game state and persist across functions
 
 # Active color theme (starts with light theme, can be toggled)
-current_theme = LIGHT_THEME.copy()
+# Refers directly to one of the theme dictionaries, which are never modified
+current_theme = LIGHT_THEME
 # Theme mode tracking: 0=Light, 1=Dark, 2=High Contrast
 theme_mode = 0
 
@@ -97,10 +162,36 @@ current_tile_size = TILE_SIZE_STANDARD  # Current active tile size
 # Sound effects enabled/disabled
 sound_effects_enabled = True
 
-# List storing recent tile clicks for visual feedback
-# Each entry is a tuple: (row_index, col_index, timestamp_ms)
+# Fade animations enabled/disabled (feedback screen and the grid fades)
+animations_enabled = True
+
+# Dictionary storing recent tile clicks for visual feedback
+# Maps (row_index, col_index) to the click timestamp in milliseconds, oldest first
 # Used to temporarily highlight clicked tiles
-click_animations = []
+click_animations = {}
+
+# Pre-rendered tile surfaces for the current round
+# 'revealed' maps each number to its tile, 'hidden' and 'clicked' are shared by all tiles
+# Emptied whenever the theme changes so the next render rebuilds it
+tile_surfaces = {}
+
+# The whole grid composited onto one surface, reused while the grid looks the same
+# 'surface' is the composite, 'key' records the (show_numbers, highlighted tiles) it shows
+# Emptied whenever the tile surfaces are rebuilt
+grid_cache = {}
+
+# Tile layouts from calculate_tile_positions(), keyed by (grid_size, tile_size)
+# There are only a few grid and tile sizes, so each layout is computed once
+tile_layouts = {}
+
+# Rendered centered text, keyed by (text, font, color)
+# Holds (surface, centered x) for strings drawn by render_text_centered(),
+# oldest first; a FIFO capped at TEXT_CACHE_LIMIT entries
+text_cache = {}
+
+# Rendered button labels, keyed by (text, font, color)
+# Menu buttons show a small fixed set of labels, so each is rasterized once
+button_label_cache = {}
 
 
 # SOUND MANAGEMENT FUNCTIONS
@@ -122,6 +213,7 @@ def generate_sound(frequency, duration):
         - Uses square wave for simple, retro-style sound effects
         - Sample rate of 22050 Hz (half of CD quality, sufficient for game sounds)
         - Generates stereo sound (2 channels)
+        - Computes a single wave cycle and repeats it for the full duration
         - Volume is set to 30% to avoid being too loud
     """
     try:
@@ -133,20 +225,28 @@ def generate_sound(frequency, duration):
         # Maximum amplitude for 16-bit signed integers
         max_amplitude = 32767
         
-        # Generate square wave samples as bytes
+        # Generate one wave cycle of samples
+        # Every cycle is identical, so only wave_period samples are computed
+        # Square wave: low for the first half of the cycle, high for the second
+        # The half-cycle bit indexes the two levels, no float math or branching
+        amplitude = int(max_amplitude * 0.3)
+        levels = (-amplitude, amplitude)
+        half_period = wave_period // 2
+        cycle_samples = [levels[(i // half_period) & 1] for i in range(wave_period)]
+        
+        # Pack as 16-bit signed integers, each sample once per stereo channel
+        # array('h') packs them in C, in the mixer's native byte order
+        cycle_bytes = array.array('h', [sample for sample in cycle_samples
+                                        for _channel in range(2)]).tobytes()
+        
+        # Repeat the cycle to fill the duration, then add the partial last cycle
+        # Each stereo sample is 4 bytes (2 channels × 2 bytes)
         num_samples = int(duration * sample_rate)
-        audio_bytes = bytearray()
-        
-        for i in range(num_samples):
-            # Square wave formula: alternates between high and low values
-            sample_value = int(max_amplitude * 0.3 * ((i % wave_period) / wave_period - 0.5) * 2)
-            
-            # Convert to 16-bit signed integer (little-endian) for both channels
-            audio_bytes.extend(sample_value.to_bytes(2, byteorder='little', signed=True))
-            audio_bytes.extend(sample_value.to_bytes(2, byteorder='little', signed=True))
+        full_cycles, leftover_samples = divmod(num_samples, wave_period)
+        audio_bytes = cycle_bytes * full_cycles + cycle_bytes[:leftover_samples * 4]
         
         # Create pygame Sound object from raw bytes
-        sound = pygame.mixer.Sound(buffer=bytes(audio_bytes))
+        sound = pygame.mixer.Sound(buffer=audio_bytes)
         sound.set_volume(0.3)
         
         return sound
@@ -222,7 +322,7 @@ def render_text(surface, text, x, y, font, color):
     # Draw the text surface onto the target surface
     surface.blit(text_surface, (x, y))
 
-def render_text_centered(surface, text, y_position, font, color):
+def render_text_centered(surface, text, y_position, font, color, cache=True):
     """
     Render text horizontally centered on the screen.
     
@@ -234,6 +334,8 @@ def render_text_centered(surface, text, y_position, font, color):
         y_position (int): Y-coordinate (horizontal centering is automatic)
         font (pygame.font.Font): Font object to use
         color (tuple): RGB color tuple
+        cache (bool): Keep the rendered text for reuse (default: True);
+                      pass False for one-off text such as the score
         
     Returns:
         None
@@ -241,35 +343,51 @@ def render_text_centered(surface, text, y_position, font, color):
     Technical Details:
         Calculates the X position by subtracting half the text width from
         half the window width, effectively centering the text.
+        
+        The rendered text and its X position are kept in text_cache, so a
+        string drawn again in the same font and color (headers, menu
+        text, countdown readings) is blitted without rendering it again.
+        The cache is a FIFO: once TEXT_CACHE_LIMIT strings are cached, the
+        oldest one added is dropped for each new one (a hit doesn't move an
+        entry), so the cache can't grow without bound.
     """
-    # Render text to get its dimensions
-    text_surface = font.render(text, True, color)
-    
-    # Calculate X position to center horizontally
-    x_position = (WINDOW_WIDTH - text_surface.get_width()) // 2
+    cache_key = (text, font, tuple(color))
+    cached = text_cache.get(cache_key) if cache else None
+    if cached is None:
+        # Render text to get its dimensions
+        text_surface = font.render(text, True, color)
+        
+        # Calculate X position to center horizontally
+        x_position = (WINDOW_WIDTH - text_surface.get_width()) // 2
+        
+        cached = (text_surface, x_position)
+        if cache:
+            # FIFO eviction: drop the oldest entry (dicts keep insertion order)
+            if len(text_cache) >= TEXT_CACHE_LIMIT:
+                del text_cache[next(iter(text_cache))]
+            text_cache[cache_key] = cached
     
     # Draw the text
+    text_surface, x_position = cached
     surface.blit(text_surface, (x_position, y_position))
 
-def draw_button(surface, text, x, y, width, height, font, is_hovered):
+def draw_button_at(surface, text, button_rect, font, is_hovered):
     """
-    Draw an interactive button with hover effects.
+    Draw an interactive button with hover effects into its rectangle.
     
     Creates a rounded rectangle button with border and centered text.
-    Color changes based on hover state for visual feedback.
+    Color changes based on hover state for visual feedback. Menus build
+    their button Rects once and reuse them for hover and click checks.
     
     Functions:
         surface (pygame.Surface): The surface to draw on
         text (str): Button label text
-        x (int): X-coordinate of button top-left corner
-        y (int): Y-coordinate of button top-left corner
-        width (int): Button width in pixels
-        height (int): Button height in pixels
+        button_rect (pygame.Rect): Area the button fills
         font (pygame.font.Font): Font for button text
         is_hovered (bool): True if mouse is currently over button
         
     Returns:
-        pygame.Rect: The button's rectangle (for collision detection)
+        None
         
     Visual Design:
         - Rounded corners (8px radius) for modern look
@@ -280,27 +398,25 @@ def draw_button(surface, text, x, y, width, height, font, is_hovered):
     # Select button color based on hover state
     button_color = current_theme['button_hover'] if is_hovered else current_theme['button']
     
-    # Create rectangle representing button area
-    button_rect = pygame.Rect(x, y, width, height)
-    
     # Draw filled button background with rounded corners
     pygame.draw.rect(surface, button_color, button_rect, border_radius=8)
     
     # Draw button border (width=2 means outline only)
     pygame.draw.rect(surface, current_theme['text_primary'], button_rect, 2, border_radius=8)
     
-    # Render button text
-    text_surface = font.render(text, True, current_theme['text_primary'])
+    # Render button text (or reuse it if this label was rendered before)
+    label_key = (text, font, tuple(current_theme['text_primary']))
+    text_surface = button_label_cache.get(label_key)
+    if text_surface is None:
+        text_surface = font.render(text, True, current_theme['text_primary'])
+        button_label_cache[label_key] = text_surface
     
     # Calculate position to center text within button
-    text_x = x + (width - text_surface.get_width()) // 2
-    text_y = y + (height - text_surface.get_height()) // 2
+    text_x = button_rect.x + (button_rect.width - text_surface.get_width()) // 2
+    text_y = button_rect.y + (button_rect.height - text_surface.get_height()) // 2
     
     # Draw centered text
     surface.blit(text_surface, (text_x, text_y))
-    
-    # Return rectangle for click detection
-    return button_rect
 
 # GRID GENERATION AND MANAGEMENT
 # Functions for creating, positioning, and rendering the game grid
@@ -323,31 +439,22 @@ def create_number_grid(size):
                          [6, 5, 8]]
                          
     Algorithm:
-        1. Create sequential list [1, 2, 3, ..., size²]
-        2. Shuffle to randomize positions
-        3. Distribute into 2D grid structure
+        1. Draw a random ordering of 1 through size² in one call
+        2. Slice into rows of length size
         
     Note:
         Each call generates a completely new random layout
     """
-    # Generate sequential numbers from 1 to size²
-    # For a 3×3 grid: [1, 2, 3, 4, 5, 6, 7, 8, 9]
-    numbers = list(range(1, size * size + 1))
-    
-    # Randomize the order in-place
-    random.shuffle(numbers)
-    
-    # Build 2D grid structure row by row
-    grid = []
-    for row_index in range(size):
-        row = []
-        for col_index in range(size):
-            # Calculate flat index in the shuffled numbers list
-            number_index = row_index * size + col_index
-            row.append(numbers[number_index])
-        grid.append(row)
-    
-    return grid
+    # Numbers 1 to size² in random order (for a 3×3 grid: 1-9)
+    # Sampling every element of the range is a shuffle, without first
+    # building the sequential list to shuffle in place
+    tile_count = size * size
+    numbers = random.sample(range(1, tile_count + 1), tile_count)
+    
+    # Build 2D grid structure by slicing one row at a time
+    # Row i holds numbers[i × size : (i + 1) × size]
+    return [numbers[row_start:row_start + size]
+            for row_start in range(0, tile_count, size)]
 
 def calculate_tile_positions(grid_size):
     """
@@ -360,17 +467,38 @@ def calculate_tile_positions(grid_size):
         grid_size (int): Number of tiles per row/column
         
     Returns:
-        list[list[tuple]]: 2D list where each element is (x, y, size)
-                          - x: Left edge of tile in pixels
-                          - y: Top edge of tile in pixels
-                          - size: Width/height of tile (uses current_tile_size)
+        dict: Tile layout for the grid
+              - 'grid_size': Number of tiles per row/column
+              - 'tile_size': Width/height of tile (uses current_tile_size)
+              - 'start_x', 'start_y': Top-left corner of the whole grid
+              - 'stride': Distance from one tile to the next (size + gap)
+              - 'xs': Left edge of each column in pixels
+              - 'ys': Top edge of each row in pixels
+              - 'rects': pygame.Rect of each tile, indexed [row][col]
+              - 'tile_offsets': ((row, col), (x, y)) for every tile in
+                                drawing order, (x, y) relative to the grid's
+                                top-left corner
                           
     Layout Algorithm:
         1. Calculate total grid dimensions including gaps
         2. Center the grid horizontally
         3. Center vertically with 40px downward offset for header
-        4. Calculate each tile position accounting for gaps
+        4. Calculate each column and row position accounting for gaps
+        
+    Note:
+        Tiles sit on a regular lattice, so the tile at (row, col) is at
+        (xs[col], ys[row]). Storing one coordinate per column and per row
+        avoids building and unpacking a tuple for every tile.
+        
+        A layout only depends on grid_size and current_tile_size, so each
+        one is built once and kept in tile_layouts. The returned dict is
+        shared between rounds and must not be modified.
     """
+    # Reuse the layout if this grid size and tile size were laid out before
+    layout_key = (grid_size, current_tile_size)
+    if layout_key in tile_layouts:
+        return tile_layouts[layout_key]
+    
     # Calculate total dimensions including gaps between tiles
     # Formula: (tiles × size) + (gaps × gap_size)
     # For 3 tiles: need 2 gaps between them
@@ -383,20 +511,190 @@ def calculate_tile_positions(grid_size):
     # Center vertically with slight downward offset for header space
     grid_start_y = (WINDOW_HEIGHT - total_grid_height) // 2 + 40
     
-    # Calculate position for each tile
-    positions = []
-    for row in range(grid_size):
-        row_positions = []
-        for col in range(grid_size):
-            # Position = start + (tile_index × (tile_size + gap))
-            tile_x = grid_start_x + col * (current_tile_size + TILE_GAP)
-            tile_y = grid_start_y + row * (current_tile_size + TILE_GAP)
-            
-            # Store as tuple: (x, y, size)
-            row_positions.append((tile_x, tile_y, current_tile_size))
-        positions.append(row_positions)
+    # Position = start + (tile_index × (tile_size + gap))
+    stride = current_tile_size + TILE_GAP
+    column_xs = tuple(grid_start_x + col * stride for col in range(grid_size))
+    row_ys = tuple(grid_start_y + row * stride for row in range(grid_size))
+    
+    # Screen rectangle of every tile, built once per layout
+    tile_rects = tuple(
+        tuple(pygame.Rect(x, y, current_tile_size, current_tile_size) for x in column_xs)
+        for y in row_ys
+    )
+    
+    # Flat table of every tile and its offset within the grid, so the grid
+    # is composited in one loop without recomputing positions
+    tile_offsets = tuple(((row, col), (col * stride, row * stride))
+                         for row in range(grid_size) for col in range(grid_size))
+    
+    layout = {
+        'grid_size': grid_size,
+        'tile_size': current_tile_size,
+        'start_x': grid_start_x,
+        'start_y': grid_start_y,
+        'stride': stride,
+        'xs': column_xs,
+        'ys': row_ys,
+        'rects': tile_rects,
+        'tile_offsets': tile_offsets
+    }
+    tile_layouts[layout_key] = layout
+    
+    return layout
+
+def get_number_glyph(number, font, color):
+    """
+    Return the rendered text surface for a tile number.
+    
+    Functions:
+        number (int): The number to render
+        font (pygame.font.Font): Font object to render it in
+        color (pygame.Color): Text color
+    
+    Returns:
+        pygame.Surface: The rendered number
+    
+    Note:
+        Surfaces are kept in glyph_cache, so each number is rasterized at
+        most once per font and color. The color is part of the key, so a
+        theme change never has to clear the cache.
+    """
+    key = (number, font, tuple(color))
+    glyph = glyph_cache.get(key)
+    if glyph is None:
+        glyph = glyph_cache[key] = font.render(str(number), True, color)
+    return glyph
+
+def build_tile_surfaces(tile_count):
+    """
+    Pre-render every tile appearance used during a round.
+    
+    Drawing rounded rectangles and rasterizing numbers for every tile on
+    every frame is the most expensive part of the round loop. Each tile
+    appearance is drawn once here so render_grid() only has to blit it.
+    
+    Functions:
+        tile_count (int): Highest number on the grid (grid_size²)
+    
+    Returns:
+        None
+    
+    Global Variables Modified:
+        - tile_surfaces: Filled with 'revealed', 'hidden' and 'clicked' surfaces
+        - grid_cache: Cleared so the grid is composited from the new tiles
+    """
+    size = current_tile_size
+    
+    # Use larger font for large tiles (fonts are loaded once at startup)
+    number_font = TILE_FONTS[current_tile_size]
+    
+    def make_tile(tile_color):
+        # Rounded tile on a transparent surface so the corners stay clear
+        tile_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(tile_surface, tile_color, (0, 0, size, size),
+                         border_radius=8)
+        return tile_surface
+    
+    # Revealed tiles: one surface per number, with the number centered on it
+    revealed = {}
+    for number in range(1, tile_count + 1):
+        tile_surface = make_tile(current_theme['tile_revealed'])
+        text_surface = get_number_glyph(number, number_font,
+                                        current_theme['text_primary'])
+        text_x = (size - text_surface.get_width()) // 2
+        text_y = (size - text_surface.get_height()) // 2
+        tile_surface.blit(text_surface, (text_x, text_y))
+        revealed[number] = tile_surface
+    
+    tile_surfaces.clear()
+    tile_surfaces['revealed'] = revealed
+    tile_surfaces['hidden'] = make_tile(current_theme['tile_hidden'])
+    tile_surfaces['clicked'] = make_tile(current_theme['tile_clicked'])
+    
+    # Any composited grid was drawn with the old tiles
+    grid_cache.clear()
+
+def compose_grid_surface(grid, positions, show_numbers):
+    """
+    Draw every tile of the grid onto one surface the size of the grid.
+    
+    render_grid() keeps the result and blits it as a single image for as
+    long as the grid looks the same, so the per-tile work only happens
+    when a tile actually changes appearance.
+    
+    Functions:
+        grid (list[list[int]]): The number grid to render
+        positions (dict): Tile layout from calculate_tile_positions()
+        show_numbers (bool): True during memorization, False during testing
+        
+    Returns:
+        pygame.Surface: Transparent surface with all tiles drawn on it,
+                        meant to be blitted at (start_x, start_y)
+    """
+    start_x = positions['start_x']
+    start_y = positions['start_y']
+    tile_size = positions['tile_size']
+    
+    # Reuse this round's surface, clearing it back to fully transparent
+    grid_surface = grid_cache.get('surface')
+    if grid_surface is None:
+        grid_width = positions['xs'][-1] + tile_size - start_x
+        grid_height = positions['ys'][-1] + tile_size - start_y
+        grid_surface = pygame.Surface((grid_width, grid_height), pygame.SRCALPHA)
+        grid_cache['surface'] = grid_surface
+    else:
+        grid_surface.fill((0, 0, 0, 0))
+    
+    # Collect (surface, position) pairs so all tiles are drawn in one call
+    tile_blits = []
+    
+    # Iterate through each tile in the grid (positions precomputed per layout)
+    for tile, offset in positions['tile_offsets']:
+        # Check if this tile was recently clicked
+        is_recently_clicked = tile in click_animations
+        
+        # Pick the pre-rendered tile for the current state
+        if is_recently_clicked:
+            # Show click feedback
+            tile_surface = tile_surfaces['clicked']
+        elif show_numbers:
+            # Memorization phase - revealed tile with its number
+            row, col = tile
+            tile_surface = tile_surfaces['revealed'][grid[row][col]]
+        else:
+            # Testing phase - plain hidden tile
+            tile_surface = tile_surfaces['hidden']
+        
+        tile_blits.append((tile_surface, offset))
+    
+    # Draw every tile with a single batched blit
+    grid_surface.blits(tile_blits, doreturn=False)
     
-    return positions
+    return grid_surface
+
+def expire_click_animations():
+    """
+    Remove click animations that have lasted CLICK_DURATION or longer.
+    
+    Returns:
+        None
+        
+    Global Variables Modified:
+        - click_animations: Expired entries are deleted in place
+        
+    Technical Details:
+        Clicks are inserted in time order and dicts keep insertion order,
+        so the oldest animation is always first. Entries are removed from
+        the front until one is still running, making the cost proportional
+        to the number that expired rather than the number stored.
+    """
+    current_time = pygame.time.get_ticks()
+    
+    while click_animations:
+        oldest_tile = next(iter(click_animations))
+        if current_time - click_animations[oldest_tile] < CLICK_DURATION:
+            break
+        del click_animations[oldest_tile]
 
 def render_grid(grid, positions, show_numbers, transparency=255):
     """
@@ -410,7 +708,7 @@ def render_grid(grid, positions, show_numbers, transparency=255):
     
     Functions:
         grid (list[list[int]]): The number grid to render
-        positions (list[list[tuple]]): Tile positions from calculate_tile_positions()
+        positions (dict): Tile layout from calculate_tile_positions()
         show_numbers (bool): True during memorization, False during testing
         transparency (int): Alpha value 0-255 for fade effects (default: 255 = fully opaque)
         
@@ -424,79 +722,29 @@ def render_grid(grid, positions, show_numbers, transparency=255):
         
     Performance Note:
         Cleans up expired click animations at the start of each call
+        (see expire_click_animations()).
+        The whole grid is composited onto one surface by
+        compose_grid_surface() and only recomposited when the phase or
+        the set of highlighted tiles changes; every other frame is a
+        single blit.
     """
-    global click_animations
-    
-    current_time = pygame.time.get_ticks()
-    
     # Remove expired click animations (older than CLICK_DURATION)
-    # List comprehension: keep only animations that are still within duration
-    click_animations = [(r, c, t) for r, c, t in click_animations 
-                       if current_time - t < CLICK_DURATION]
-    
-    # Iterate through each tile in the grid
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            # Get tile position and size
-            x, y, size = positions[row][col]
-            
-            # Check if this tile was recently clicked
-            is_recently_clicked = any(r == row and c == col 
-                                     for r, c, _ in click_animations)
-            
-            # Determine tile color based on current state
-            if is_recently_clicked:
-                # Show click feedback
-                tile_color = current_theme['tile_clicked']
-            elif show_numbers:
-                # Memorization phase - use revealed color
-                tile_color = current_theme['tile_revealed']
-            else:
-                # Testing phase - use hidden color
-                tile_color = current_theme['tile_hidden']
-            
-            # Draw tile with optional transparency for fade effects
-            if transparency < 255:
-                # Create temporary surface with alpha channel
-                tile_surface = pygame.Surface((size, size))
-                tile_surface.set_alpha(transparency)
-                tile_surface.fill(tile_color)
-                display.blit(tile_surface, (x, y))
-            else:
-                # Normal drawing (no transparency needed)
-                pygame.draw.rect(display, tile_color, (x, y, size, size), 
-                               border_radius=8)
-            
-            # Render number on tile if in reveal mode
-            if show_numbers:
-                number_text = str(grid[row][col])
-                
-                # Use larger font for large tiles
-                if current_tile_size >= TILE_SIZE_EXTRA_LARGE:
-                    try:
-                        number_font = pygame.font.Font("Montserrat-Regular.ttf", 48)
-                    except:
-                        number_font = pygame.font.SysFont("montserrat", 48)
-                elif current_tile_size >= TILE_SIZE_LARGE:
-                    try:
-                        number_font = pygame.font.Font("Montserrat-Regular.ttf", 42)
-                    except:
-                        number_font = pygame.font.SysFont("montserrat", 42)
-                else:
-                    number_font = FONT_LARGE
-                
-                text_surface = number_font.render(number_text, True, 
-                                                current_theme['text_primary'])
-                
-                # Apply same transparency to text as tile
-                if transparency < 255:
-                    text_surface.set_alpha(transparency)
-                
-                # Center number on tile
-                text_x = x + (size - text_surface.get_width()) // 2
-                text_y = y + (size - text_surface.get_height()) // 2
-                
-                display.blit(text_surface, (text_x, text_y))
+    expire_click_animations()
+    
+    # Rebuild the tile surfaces if a theme change invalidated them
+    if not tile_surfaces:
+        build_tile_surfaces(len(grid) * len(grid))
+    
+    # Recomposite the grid only if it should look different from last time
+    grid_key = (show_numbers, frozenset(click_animations))
+    if grid_cache.get('key') != grid_key:
+        compose_grid_surface(grid, positions, show_numbers)
+        grid_cache['key'] = grid_key
+    
+    # Apply fade transparency (255 = fully opaque) to the whole grid at once
+    grid_surface = grid_cache['surface']
+    grid_surface.set_alpha(transparency)
+    display.blit(grid_surface, (positions['start_x'], positions['start_y']))
 
 def get_tile_at_position(mouse_x, mouse_y, grid, positions):
     """
@@ -509,40 +757,57 @@ def get_tile_at_position(mouse_x, mouse_y, grid, positions):
         mouse_x (int): Mouse X coordinate in pixels
         mouse_y (int): Mouse Y coordinate in pixels
         grid (list[list[int]]): The number grid
-        positions (list[list[tuple]]): Tile positions from calculate_tile_positions()
+        positions (dict): Tile layout from calculate_tile_positions()
         
     Returns:
         tuple: (number, row, col) if click is on a tile
                (None, None, None) if click is not on any tile
                
     Algorithm:
-        Iterates through all tiles checking if mouse position is within
-        the rectangular bounds of each tile.
+        Tiles sit on a regular lattice, so the click offset from the grid's
+        top-left corner divided by the stride (tile size + gap) gives the
+        row and column directly. The remainder tells whether the click
+        landed on the tile itself or in the gap after it.
         
     Use Case:
         Called when player clicks during the testing phase to validate
         their answer and provide visual feedback.
     """
-    # Check each tile position
-    for row in range(len(positions)):
-        for col in range(len(positions[row])):
-            tile_x, tile_y, tile_size = positions[row][col]
-            
-            # Check if click is within tile boundaries
-            # Tile occupies rectangle from (tile_x, tile_y) to 
-            # (tile_x + tile_size, tile_y + tile_size)
-            if (tile_x <= mouse_x <= tile_x + tile_size and 
-                tile_y <= mouse_y <= tile_y + tile_size):
-                # Return the number at this position and its coordinates
-                return grid[row][col], row, col
+    grid_size = positions['grid_size']
+    tile_size = positions['tile_size']
+    stride = positions['stride']
+    
+    # Which column/row the click falls in, and how far into that cell
+    col, offset_x = divmod(mouse_x - positions['start_x'], stride)
+    row, offset_y = divmod(mouse_y - positions['start_y'], stride)
+    
+    # Click was outside the grid
+    if not (0 <= row < grid_size and 0 <= col < grid_size):
+        return None, None, None
+    
+    # Click was in the gap between tiles
+    # Tile occupies offsets 0 to tile_size (inclusive) within its cell
+    if offset_x > tile_size or offset_y > tile_size:
+        return None, None, None
     
-    # Click was not on any tile
-    return None, None, None
+    # Return the number at this position and its coordinates
+    return grid[row][col], row, col
 
 # =============================================================================
 # Functions for The Difficulty Progression Systems
 # =============================================================================
 
+# Difficulty Tier Table
+# A tier starts at each score in DIFFICULTY_THRESHOLDS (the first tier starts at 0)
+# Each tier is (grid_size, memorization_time)
+DIFFICULTY_THRESHOLDS = (3, 7, 12)
+DIFFICULTY_TIERS = (
+    (3, MEMORIZATION_TIME + 0.3), # Beginner: small grid with extra time
+    (4, MEMORIZATION_TIME), # Intermediate: medium grid, standard time
+    (5, MEMORIZATION_TIME - 0.2), # Advanced: large grid, slightly less time
+    (5, max(MEMORIZATION_TIME - 0.5, 3.0)) # Expert: reduced time, never below 3 seconds
+)
+
 def get_difficulty_settings(score):
     """
     Calculate appropriate grid size and time limit based on player's score.
@@ -569,19 +834,12 @@ def get_difficulty_settings(score):
         - Grid size increases first (spatial challenge)
         - Time pressure increases second (temporal challenge)
         - Minimum time limit prevents impossibility
+        
+    Algorithm:
+        bisect_right counts how many tier thresholds the score has reached,
+        which is the index of the player's tier in DIFFICULTY_TIERS
     """
-    if score < 3:
-        # Beginner tier: Small grid with extra time
-        return 3, MEMORIZATION_TIME + 0.3
-    elif score < 7:
-        # Intermediate tier: Medium grid, standard time
-        return 4, MEMORIZATION_TIME
-    elif score < 12:
-        # Advanced tier: Large grid, slightly less time
-        return 5, MEMORIZATION_TIME - 0.2
-    else:
-        # Expert tier: Large grid, reduced time (but never below 3 seconds)
-        return 5, max(MEMORIZATION_TIME - 0.5, 3.0)
+    return DIFFICULTY_TIERS[bisect.bisect_right(DIFFICULTY_THRESHOLDS, score)]
 
 def cycle_theme():
     """
@@ -594,6 +852,7 @@ def cycle_theme():
     Global Variables Modified:
         - theme_mode: Cycles through 0, 1, 2 (Light, Dark, High Contrast)
         - current_theme: Updated with new theme colors
+        - tile_surfaces: Cleared so tiles are re-rendered in the new colors
         
     Returns:
         None
@@ -603,13 +862,11 @@ def cycle_theme():
     # Toggle the flag
     theme_mode = (theme_mode + 1) % 3
     
-    # Apply the appropriate theme (using copy to avoid reference issues)
-    if theme_mode == 0:
-        current_theme = LIGHT_THEME.copy()
-    elif theme_mode == 1:
-        current_theme = DARK_THEME.copy()
-    else:
-        current_theme = HIGH_CONTRAST_THEME.copy()
+    # Apply the appropriate theme (by reference - themes are never modified)
+    current_theme = THEMES[theme_mode]
+    
+    # Pre-rendered tiles still use the old colors
+    tile_surfaces.clear()
 
 def toggle_large_tiles():
     """
@@ -643,16 +900,168 @@ def set_extra_large_tiles(enabled):
         
     Returns:
         None
+        
+    Note:
+        Disabling goes back to the size use_large_tiles selects, rather
+        than toggling it, so the result doesn't depend on earlier calls.
     """
     global current_tile_size
     
     if enabled:
         current_tile_size = TILE_SIZE_EXTRA_LARGE
+    elif use_large_tiles:
+        current_tile_size = TILE_SIZE_LARGE
+    else:
+        current_tile_size = TILE_SIZE_STANDARD
+
+def select_large_tiles():
+    """
+    Apply a click on the settings menu's Large Tiles button.
+    
+    Leaving extra large tiles goes straight back to standard tiles;
+    otherwise the large tile size is toggled.
+    
+    Global Variables Modified:
+        - use_large_tiles, current_tile_size
+        
+    Returns:
+        None
+    """
+    global use_large_tiles, current_tile_size
+    
+    if current_tile_size == TILE_SIZE_EXTRA_LARGE:
+        current_tile_size = TILE_SIZE_STANDARD
+        use_large_tiles = False
     else:
         toggle_large_tiles()
 
+def select_extra_large_tiles():
+    """
+    Apply a click on the settings menu's Extra Large Tiles button.
+    
+    Turns extra large tiles on (which counts as large tiles too), or
+    turns them off and goes back to standard tiles.
+    
+    Global Variables Modified:
+        - use_large_tiles, current_tile_size
+        
+    Returns:
+        None
+    """
+    global use_large_tiles, current_tile_size
+    
+    if current_tile_size == TILE_SIZE_EXTRA_LARGE:
+        current_tile_size = TILE_SIZE_STANDARD
+        use_large_tiles = False
+    else:
+        set_extra_large_tiles(True)
+        use_large_tiles = True
+
+def toggle_sound_effects():
+    """
+    Turn sound effects on or off.
+    
+    Global Variables Modified:
+        - sound_effects_enabled: Flipped to opposite state
+        
+    Returns:
+        None
+    """
+    global sound_effects_enabled
+    
+    sound_effects_enabled = not sound_effects_enabled
+
+def toggle_animations():
+    """
+    Turn the fade animations (screens and the grid) on or off.
+    
+    Global Variables Modified:
+        - animations_enabled: Flipped to opposite state
+        
+    Returns:
+        None
+    """
+    global animations_enabled
+    
+    animations_enabled = not animations_enabled
+
+# EVENT HANDLING HELPERS
+
+def poll_events():
+    """
+    Return the handled events waiting on the queue.
+    
+    SDL is pumped once, then the queue is checked for HANDLED_EVENTS
+    before anything is fetched. Most frames have no input at all, so
+    they return an empty tuple without building a list of Event objects.
+    
+    Returns:
+        list or tuple: Queued events whose type is in HANDLED_EVENTS
+    """
+    pygame.event.pump()
+    if not pygame.event.peek(HANDLED_EVENTS, pump=False):
+        return ()
+    return pygame.event.get(HANDLED_EVENTS, pump=False)
+
+def wait_for_events(timeout_ms):
+    """
+    Sleep until a handled event arrives, then return the waiting events.
+    
+    Used by menus once they are fully drawn and nothing on them animates,
+    so an idle menu sleeps in SDL instead of ticking through identical
+    frames at 60 FPS.
+    
+    Functions:
+        timeout_ms (int): Longest time to sleep in milliseconds
+        
+    Returns:
+        list or tuple: Queued events whose type is in HANDLED_EVENTS, or an
+                       empty tuple if none arrived within timeout_ms
+        
+    Note:
+        MOUSEMOTION is blocked, so moving the mouse doesn't wake the wait.
+        The timeout bounds how late a hover highlight can appear.
+    """
+    event = pygame.event.wait(timeout_ms)
+    if event.type == pygame.NOEVENT:
+        return ()
+    return [event] + pygame.event.get(HANDLED_EVENTS, pump=False)
+
 # FADE ANIMATION HELPERS
 
+def fade_alpha_steps(duration_ms, start_alpha, end_alpha):
+    """
+    Yield the alpha value for each frame of a fade, based on elapsed time.
+    
+    The alpha is worked out from pygame.time.get_ticks() rather than
+    stepped by a fixed amount per frame, so a fade lasts duration_ms no
+    matter how fast frames are drawn.
+    
+    Functions:
+        duration_ms (int): Length of the fade in milliseconds
+        start_alpha (int): Alpha value at the start of the fade (0-255)
+        end_alpha (int): Alpha value the fade moves towards (0-255)
+        
+    Yields:
+        int: Alpha value for the current frame
+        
+    Note:
+        Stops once duration_ms has passed, without yielding end_alpha
+        itself (matching the old range()-based loops)
+        
+        SDL is pumped every frame so the window keeps responding to the
+        OS during a fade; the events stay queued for the next loop.
+    """
+    start_time = pygame.time.get_ticks()
+    alpha_change = end_alpha - start_alpha
+    
+    while True:
+        pygame.event.pump()
+        elapsed = pygame.time.get_ticks() - start_time
+        if elapsed >= duration_ms:
+            return
+        yield start_alpha + alpha_change * elapsed // duration_ms
+
 def fade_in_screen():
     """
     Fade in the entire screen from black when pygame initializes.
@@ -661,18 +1070,19 @@ def fade_in_screen():
     
     Returns:
         None
+        
+    Note:
+        Frames are paced with pygame.time.wait(16), which sleeps in
+        SDL_Delay; the fade length comes from fade_alpha_steps(), so
+        Clock.tick()'s exact frame pacing isn't needed here.
     """
-    clock = pygame.time.Clock()
-    fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-    
-    # Fade from black to transparent over approximately 500ms
-    for alpha in range(255, 0, -ANIMATION_SPEED * 2):
+    # Fade from black to transparent over SCREEN_FADE_IN_DURATION
+    for alpha in fade_alpha_steps(SCREEN_FADE_IN_DURATION, 255, 0):
         display.fill(current_theme['background'])
-        fade_surface.set_alpha(alpha)
-        fade_surface.fill((0, 0, 0))
-        display.blit(fade_surface, (0, 0))
+        fade_overlay.set_alpha(alpha)
+        display.blit(fade_overlay, (0, 0))
         pygame.display.update()
-        clock.tick(60)
+        pygame.time.wait(16)
 
 def fade_transition(duration_ms=500):
     """
@@ -682,40 +1092,79 @@ def fade_transition(duration_ms=500):
     between rounds or game states.
     
     Functions:
-        duration_ms (int): Duration of fade in milliseconds
+        duration_ms (int): Duration of each half of the fade in milliseconds
         
     Returns:
         None
+        
+    Note:
+        Paced with pygame.time.wait(16) like fade_in_screen().
     """
-    clock = pygame.time.Clock()
-    fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-    frames = max(1, duration_ms // 16)  # ~60 FPS
-    
     # Fade to black
-    for alpha in range(0, 255, 255 // frames):
+    for alpha in fade_alpha_steps(duration_ms, 0, 255):
         display.fill(current_theme['background'])
-        fade_surface.set_alpha(alpha)
-        fade_surface.fill((0, 0, 0))
-        display.blit(fade_surface, (0, 0))
+        fade_overlay.set_alpha(alpha)
+        display.blit(fade_overlay, (0, 0))
         pygame.display.update()
-        clock.tick(60)
+        pygame.time.wait(16)
     
-    # Hold black briefly
-    pygame.time.delay(100)
+    # Hold black briefly (wait sleeps instead of busy-waiting like delay)
+    pygame.time.wait(100)
     
     # Fade from black
-    for alpha in range(255, 0, -255 // frames):
+    for alpha in fade_alpha_steps(duration_ms, 255, 0):
         display.fill(current_theme['background'])
-        fade_surface.set_alpha(alpha)
-        fade_surface.fill((0, 0, 0))
-        display.blit(fade_surface, (0, 0))
+        fade_overlay.set_alpha(alpha)
+        display.blit(fade_overlay, (0, 0))
         pygame.display.update()
-        clock.tick(60)
+        pygame.time.wait(16)
 
 # =============================================================================
 # GAME ROUND LOGIC
 # =============================================================================
 
+def draw_round_backdrop(surface):
+    """
+    Draw the parts of the round screen that stay the same for a whole round.
+    
+    Fills the surface with the theme background and draws the title and
+    instructions header on it. execute_game_round() draws this onto an
+    off-screen surface and blits it every frame, including during the
+    grid fades, instead of repeating the fill and font rendering.
+    
+    Functions:
+        surface (pygame.Surface): Window-sized surface to draw on
+        
+    Returns:
+        None
+    """
+    surface.fill(current_theme['background'])
+    
+    # Header (shown in all phases)
+    render_text_centered(surface, "MonkeyTrain", 10, FONT_TITLE,
+                       current_theme['text_primary'])
+    render_text_centered(surface,
+                       "Memorize the positions, then click in order: 1, 2, 3...",
+                       80, FONT_SMALL, current_theme['text_secondary'])
+
+def render_status_line(text, color):
+    """
+    Draw the round's countdown or progress line, centered at y=120.
+    
+    Functions:
+        text (str): The status text, e.g. "Memorize: 9.8s" or "Progress: 3 / 9"
+        color (pygame.Color): Text color
+        
+    Returns:
+        None
+        
+    Performance Note:
+        Every round shows the same countdown readings and progress counts,
+        so each line is only rasterized the first time it appears (see
+        render_text_centered()).
+    """
+    render_text_centered(display, text, 120, FONT_MEDIUM, color)
+
 def execute_game_round(grid_size, reveal_duration):
     """
     Execute a complete game round from memorization to completion/failure.
@@ -763,8 +1212,12 @@ def execute_game_round(grid_size, reveal_duration):
     # Calculate where each tile should be drawn on screen
     tile_positions = calculate_tile_positions(grid_size)
     
-    # The correct sequence is simply 1, 2, 3, ..., N²
-    correct_sequence = list(range(1, grid_size * grid_size + 1))
+    # Pre-render the tiles for this round's grid size, tile size and theme
+    build_tile_surfaces(grid_size * grid_size)
+    
+    # The correct sequence is simply 1, 2, 3, ..., N², so the next number
+    # expected is always one more than the number of correct clicks so far
+    tile_count = grid_size * grid_size
     
     # -------------------------------------------------------------------------
     # Game State Initialization
@@ -773,118 +1226,77 @@ def execute_game_round(grid_size, reveal_duration):
     # Start in memorization phase (showing numbers)
     is_revealing_numbers = True
     
-    # Track player's clicked sequence
-    player_clicks = []
+    # Track how many numbers the player has clicked in order
+    correct_clicks = 0
     
     # Clear any previous click animations
-    click_animations = []
+    click_animations = {}
     
 
+    # Static Frame Parts
+    # The background, header and footer only change with the theme, so they
+    # are drawn once onto round_backdrop (and the footer rendered once) and
+    # blitted every frame instead of being filled and re-rasterized
+    round_backdrop = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    draw_round_backdrop(round_backdrop)
+    # Left unset so the main loop also renders the footer on its first pass
+    backdrop_theme = None  # theme_mode round_backdrop was drawn for
+    
     # Fade In Animation
     # Gradually increase opacity from 0 to 255 for smooth appearance
-    
-    clock = pygame.time.Clock()
-    for alpha in range(0, 255, ANIMATION_SPEED):
-        # Draw 3D background
-        display.fill(current_theme['background'])
-        
-        # Draw header
-        render_text_centered(display, "MonkeyTrain", 10, FONT_TITLE, 
-                           current_theme['text_primary'])
-        render_text_centered(display, 
-                           "Memorize the positions, then click in order: 1, 2, 3...", 
-                           100, FONT_SMALL, current_theme['text_secondary'])
-        
-        # Draw grid with increasing transparency
-        render_grid(grid, tile_positions, show_numbers=True, transparency=alpha)
-        
-        # Update display
-        pygame.display.update()
-        
-        # Small delay for smooth animation (target 60 FPS)
-        clock.tick(60)
+    # (skipped when animations are turned off; the main loop's first frame
+    # then shows the grid at once)
+    if animations_enabled:
+        for alpha in fade_alpha_steps(GRID_FADE_IN_DURATION, 0, 255):
+            # Draw background and header
+            display.blit(round_backdrop, (0, 0))
+            
+            # Draw grid with increasing transparency
+            render_grid(grid, tile_positions, show_numbers=True, transparency=alpha)
+            
+            # Update display
+            pygame.display.update()
+            
+            # Sleep roughly one 60 FPS frame; fade_alpha_steps() keeps the timing
+            pygame.time.wait(16)
     
     # Record when memorization phase started (in milliseconds)
     # Timer starts AFTER fade-in completes
     reveal_start_time = pygame.time.get_ticks()
     
+    # Frame clock for the main loop (the fades pace themselves)
+    clock = frame_clock
+    
+    # When memorization ends, so each frame compares integer ticks
+    reveal_end_time = reveal_start_time + round(reveal_duration * 1000)
+    
+    # Dirty Rectangle Tracking
+    # Between frames only the timer/progress line and click-highlighted tiles
+    # change, so the whole window is only pushed when the phase or theme changes
+    status_rect = pygame.Rect(0, 120, WINDOW_WIDTH, FONT_MEDIUM.get_height())
+    tile_rects = tile_positions['rects']
+    last_screen_state = None  # (phase, theme) of the last full update
+    previous_animated_tiles = set()  # Tiles highlighted on the previous frame
+    drawn_frame_key = None  # What the last testing-phase frame showed
+    
     # -------------------------------------------------------------------------
     # Main Round Loop
     # -------------------------------------------------------------------------
     # Continues until player completes sequence, makes error, or quits
     
     while True:
-        # Draw 3D background (updates animation)
-        display.fill(current_theme['background'])
-        
-        # Header (shown in all phases)
-        render_text_centered(display, "MonkeyTrain", 10, FONT_TITLE, 
-                           current_theme['text_primary'])
-        render_text_centered(display, 
-                           "Memorize the positions, then click in order: 1, 2, 3...", 
-                           80, FONT_SMALL, current_theme['text_secondary'])
-        
-
-        # Time Calculation
-        current_time = pygame.time.get_ticks()
-        elapsed = (current_time - reveal_start_time) / 1000.0  # Convert to seconds
-        
-
-        # Phase 1: Memorization (Reveal Phase)
-        if is_revealing_numbers:
-            # Calculate remaining time
-            time_left = max(0, reveal_duration - elapsed)
-            
-            # Display countdown timer
-            timer_display = f"Memorize: {time_left:.1f}s"
-            render_text_centered(display, timer_display, 120, FONT_MEDIUM, 
-                               current_theme['success'])
-            
-            # Show grid with numbers visible
-            render_grid(grid, tile_positions, show_numbers=True)
-            
-            # Check if memorization time has elapsed
-            if elapsed >= reveal_duration:
-                is_revealing_numbers = False  # Transition to testing phase
-                
-                # Smooth transition: fade out numbers
-                for alpha in range(255, 0, -ANIMATION_SPEED * 3):
-                    display.fill(current_theme['background'])
-                    render_text_centered(display, "MonkeyTrain", 10, FONT_TITLE, 
-                                       current_theme['text_primary'])
-                    render_text_centered(display, 
-                                       "Memorize the positions, then click in order: 1, 2, 3...", 
-                                       80, FONT_SMALL, current_theme['text_secondary'])
-                    render_grid(grid, tile_positions, show_numbers=True, transparency=alpha)
-                    pygame.display.update()
-                    clock.tick(60)
-        
-        # Phase 2: Testing (Click Phase)
-        else:
-            # Display progress counter
-            progress_display = f"Progress: {len(player_clicks)} / {len(correct_sequence)}"
-            render_text_centered(display, progress_display, 120, FONT_MEDIUM, 
-                               current_theme['text_primary'])
-            
-            # Show grid with numbers hidden
-            render_grid(grid, tile_positions, show_numbers=False)
-        
-        # Footer Controls (shown in all phases)
-        render_text_centered(display, "ESC: Menu | D: Theme Toggle", 
-                           WINDOW_HEIGHT - 35, FONT_TINY, 
-                           current_theme['text_secondary'])
-        
-        # Update the display with all drawn elements
-        pygame.display.update()
-        
         # Event Handling
-        # Process all queued events (clicks, key presses, window close, etc.)
+        # Process the queued events (clicks, key presses, window close, expose)
         
-        for event in pygame.event.get():
+        for event in poll_events():
             # Window close button clicked
             if event.type == pygame.QUIT:
                 return None  # Signal to quit game
             
+            # Window uncovered - repaint all of it this frame
+            if event.type == pygame.VIDEOEXPOSE:
+                last_screen_state = None
+            
             # Keyboard input
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -896,8 +1308,9 @@ def execute_game_round(grid_size, reveal_duration):
             
             # Mouse clicks (only processed during testing phase)
             if event.type == pygame.MOUSEBUTTONDOWN and not is_revealing_numbers:
-                # Get mouse position
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                # Where this click happened (not where the cursor is now, so
+                # several clicks read in one poll each hit their own tile)
+                mouse_x, mouse_y = event.pos
                 
                 # Determine which tile (if any) was clicked
                 clicked_value, row, col = get_tile_at_position(
@@ -906,33 +1319,168 @@ def execute_game_round(grid_size, reveal_duration):
                 # If a tile was clicked (not empty space)
                 if clicked_value is not None:
                     # Add visual click feedback
-                    click_animations.append((row, col, pygame.time.get_ticks()))
+                    # (re-inserted at the end so the dict stays in time order)
+                    click_animations.pop((row, col), None)
+                    click_animations[(row, col)] = pygame.time.get_ticks()
                     
                     # Play click sound feedback
                     play_sound_effect(sound_click)
                     
-                    # Add to player's click sequence
-                    player_clicks.append(clicked_value)
-                    
-                    # Get index of this click (0-based)
-                    click_index = len(player_clicks) - 1
-                    
-                    # Validate Click 
-                    if player_clicks[click_index] != correct_sequence[click_index]:
+                    # Validate Click
+                    if clicked_value != correct_clicks + 1:
                         # Wrong number clicked - immediate failure
                         play_sound_effect(sound_failure)
                         return False  # End round with failure
                     
+                    correct_clicks += 1
+                    
                     # If player has clicked all numbers correctly
-                    if len(player_clicks) == len(correct_sequence):
+                    if correct_clicks == tile_count:
                         # Success! Player completed the sequence
                         play_sound_effect(sound_success)
                         return True  # End round with success
+        
+        # Testing-phase frames only change when a click highlight starts or
+        # ends, the progress count changes or the theme changes; while none
+        # has happened (the player is thinking), skip drawing and updating
+        if not is_revealing_numbers:
+            expire_click_animations()
+            frame_key = (theme_mode, correct_clicks, frozenset(click_animations))
+            if frame_key == drawn_frame_key and last_screen_state is not None:
+                clock.tick(60)
+                continue
+            drawn_frame_key = frame_key
+        
+        # Redraw the static parts only after a theme change
+        if backdrop_theme != theme_mode:
+            draw_round_backdrop(round_backdrop)
+            
+            # Footer controls (kept separate so it still draws over the grid)
+            footer_surface = FONT_TINY.render("ESC: Menu | D: Theme Toggle", True,
+                                              current_theme['text_secondary'])
+            footer_position = ((WINDOW_WIDTH - footer_surface.get_width()) // 2,
+                               WINDOW_HEIGHT - 35)
+            backdrop_theme = theme_mode
+        
+        # Background and header in one blit
+        display.blit(round_backdrop, (0, 0))
+        
+
+        # Phase 1: Memorization (Reveal Phase)
+        if is_revealing_numbers:
+            # Calculate remaining time (only the reveal phase needs the clock)
+            current_time = pygame.time.get_ticks()
+            time_left = max(0, reveal_end_time - current_time) / 1000.0  # Convert to seconds
+            
+            # Display countdown timer
+            timer_display = f"Memorize: {time_left:.1f}s"
+            render_status_line(timer_display, current_theme['success'])
+            
+            # Show grid with numbers visible
+            render_grid(grid, tile_positions, show_numbers=True)
+            
+            # Check if memorization time has elapsed
+            if current_time >= reveal_end_time:
+                is_revealing_numbers = False  # Transition to testing phase
+                
+                # Smooth transition: fade out numbers (unless animations are off)
+                if animations_enabled:
+                    for alpha in fade_alpha_steps(GRID_FADE_OUT_DURATION, 255, 0):
+                        display.blit(round_backdrop, (0, 0))
+                        render_grid(grid, tile_positions, show_numbers=True, transparency=alpha)
+                        pygame.display.update()
+                        pygame.time.wait(16)
+                
+                # Start over so the first testing frame is drawn and shown in full
+                continue
+        
+        # Phase 2: Testing (Click Phase)
+        else:
+            # Display progress counter
+            progress_display = f"Progress: {correct_clicks} / {tile_count}"
+            render_status_line(progress_display, current_theme['text_primary'])
+            
+            # Show grid with numbers hidden
+            render_grid(grid, tile_positions, show_numbers=False)
+        
+        # Footer Controls (shown in all phases)
+        display.blit(footer_surface, footer_position)
+        
+        # Update the display with the parts that changed
+        screen_state = (is_revealing_numbers, theme_mode)
+        animated_tiles = set(click_animations)
+        if screen_state != last_screen_state:
+            # First frame, new phase or new theme - everything changed
+            pygame.display.update()
+            last_screen_state = screen_state
+        else:
+            # Timer/progress line plus tiles whose click highlight started or ended
+            dirty_rects = [status_rect]
+            for row, col in animated_tiles | previous_animated_tiles:
+                dirty_rects.append(tile_rects[row][col])
+            pygame.display.update(dirty_rects)
+        previous_animated_tiles = animated_tiles
+        
+        if is_revealing_numbers:
+            # Only the countdown changes while memorizing, and it shows tenths
+            # of a second - sleep until its next tenth instead of redrawing
+            pygame.time.wait(100 - (pygame.time.get_ticks() - reveal_start_time) % 100)
+        else:
+            # Cap the round at 60 FPS instead of redrawing as fast as possible
+            clock.tick(60)
 
 # =============================================================================
 # MENU SCREENS
 # =============================================================================
 
+# Accessibility settings buttons, top to bottom, each followed by its two
+# description lines (the back button has none)
+SETTINGS_DESCRIPTIONS = (
+    ("Enhances visibility with maximum contrast between",
+     "background and foreground elements for better readability"),
+    ("Increases tile size to make numbers easier to see",
+     "and click, improving clarity for visual accessibility"),
+    ("Maximum tile size for optimal visibility and easier",
+     "interaction, ideal for users with visual impairments"),
+    ("Provides audio feedback for clicks and game events",
+     "to enhance gameplay experience and accessibility"),
+    ("Fades screens and the grid in and out; turn off to",
+     "reduce motion and show each screen straight away"),
+)
+
+def draw_settings_backdrop(surface, button_rects):
+    """
+    Draw the parts of the settings menu that only change with the theme.
+    
+    Fills the surface with the theme background and draws the title, the
+    description under each toggle button and the footer.
+    display_settings_menu() keeps this on an off-screen surface and only
+    draws the buttons over it.
+    
+    Functions:
+        surface (pygame.Surface): Window-sized surface to draw on
+        button_rects (list[pygame.Rect]): Toggle button rectangles, in
+                                          SETTINGS_DESCRIPTIONS order
+        
+    Returns:
+        None
+    """
+    text_secondary = current_theme['text_secondary']
+    
+    surface.fill(current_theme['background'])
+    
+    render_text_centered(surface, "Accessibility Settings", 60, FONT_TITLE,
+                         current_theme['text_primary'])
+    
+    # Two description lines under each toggle button, centered in the gap
+    # before the next one
+    for button_rect, (first_line, second_line) in zip(button_rects, SETTINGS_DESCRIPTIONS):
+        render_text_centered(surface, first_line, button_rect.y + 60, FONT_TINY, text_secondary)
+        render_text_centered(surface, second_line, button_rect.y + 74, FONT_TINY, text_secondary)
+    
+    render_text_centered(surface, "Press ESC to return to menu",
+                         WINDOW_HEIGHT - 30, FONT_TINY, text_secondary)
+
 def display_settings_menu():
     """
     Display accessibility settings menu.
@@ -941,116 +1489,134 @@ def display_settings_menu():
     - High contrast mode toggle
     - Large and extra large tile sizes
     - Sound effects toggle
+    - Fade animations toggle
     
     Returns:
         None (returns to menu when back button clicked or ESC pressed)
+        
+    Performance Note:
+        Titles and descriptions live on a backdrop surface drawn once per
+        theme (see draw_settings_backdrop()). A frame is only drawn when a
+        hover state or setting changed, and unless the theme changed only
+        the button rectangles are restored, redrawn and pushed.
     """
-    global current_tile_size, use_large_tiles, sound_effects_enabled
-    
-    clock = pygame.time.Clock()
+    # Buttons never move, so their rectangles are built once for hover and
+    # click checks, 98px apart starting at y=128
+    button_width, button_height = 320, 50
+    button_x = (WINDOW_WIDTH - button_width) // 2
+    hc_btn = pygame.Rect(button_x, 128, button_width, button_height)
+    large_btn = pygame.Rect(button_x, 226, button_width, button_height)
+    xlarge_btn = pygame.Rect(button_x, 324, button_width, button_height)
+    sound_btn = pygame.Rect(button_x, 422, button_width, button_height)
+    anim_btn = pygame.Rect(button_x, 520, button_width, button_height)
+    back_btn = pygame.Rect(button_x, 618, button_width, button_height)
+    button_rects = [hc_btn, large_btn, xlarge_btn, sound_btn, anim_btn, back_btn]
+    
+    # What a click on each toggle button does (the back button leaves the
+    # menu, so it is checked separately)
+    button_actions = ((hc_btn, cycle_theme),
+                      (large_btn, select_large_tiles),
+                      (xlarge_btn, select_extra_large_tiles),
+                      (sound_btn, toggle_sound_effects),
+                      (anim_btn, toggle_animations))
+    
+    # Off-screen copy of the static text, redrawn when the theme changes
+    backdrop = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    backdrop_theme = None  # theme_mode backdrop was drawn for
+    
+    # Hover and settings state of the last drawn frame (None forces a full redraw)
+    last_frame_state = None
     
     while True:
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        display.fill(current_theme['background'])
-        
-        render_text_centered(display, "Accessibility Settings", 60, FONT_TITLE, current_theme['text_primary'])
-        
-        button_width, button_height = 320, 50
-        button_x = (WINDOW_WIDTH - button_width) // 2
-        
-        y_pos = 150
-
-        # High Contrast Mode button
-        hc_text = f"High Contrast Mode: {'ON' if theme_mode == 2 else 'OFF'}"
-        hc_hover = (button_x <= mouse_x <= button_x + button_width and y_pos <= mouse_y <= y_pos + button_height)
-        hc_btn = draw_button(display, hc_text, button_x, y_pos, button_width, button_height, FONT_MEDIUM, hc_hover)
-        # Description text for High Contrast Mode
-        render_text_centered(display, "Enhances visibility with maximum contrast between", 
-                           y_pos + 60, FONT_TINY, current_theme['text_secondary'])
-        render_text_centered(display, "background and foreground elements for better readability", 
-                           y_pos + 75, FONT_TINY, current_theme['text_secondary'])
-        
-        y_pos += 110
-        
-        # Large Tiles button
-        large_text = f"Large Tiles: {'ON' if use_large_tiles else 'OFF'}"
-        large_hover = (button_x <= mouse_x <= button_x + button_width and y_pos <= mouse_y <= y_pos + button_height)
-        large_btn = draw_button(display, large_text, button_x, y_pos, button_width, button_height, FONT_MEDIUM, large_hover)
-        # Description text for Large Tiles
-        render_text_centered(display, "Increases tile size to make numbers easier to see", 
-                           y_pos + 60, FONT_TINY, current_theme['text_secondary'])
-        render_text_centered(display, "and click, improving clarity for visual accessibility", 
-                           y_pos + 75, FONT_TINY, current_theme['text_secondary'])
-        
-        y_pos += 110
-        
-        # Extra Large Tiles button
-        xlarge_text = f"Extra Large Tiles: {'ON' if current_tile_size == TILE_SIZE_EXTRA_LARGE else 'OFF'}"
-        xlarge_hover = (button_x <= mouse_x <= button_x + button_width and y_pos <= mouse_y <= y_pos + button_height)
-        xlarge_btn = draw_button(display, xlarge_text, button_x, y_pos, button_width, button_height, FONT_MEDIUM, xlarge_hover)
-        # Description text for Extra Large Tiles
-        render_text_centered(display, "Maximum tile size for optimal visibility and easier", 
-                           y_pos + 60, FONT_TINY, current_theme['text_secondary'])
-        render_text_centered(display, "interaction, ideal for users with visual impairments", 
-                           y_pos + 75, FONT_TINY, current_theme['text_secondary'])
-        
-        y_pos += 110
-        
-        # Sound Effects button
-        sound_text = f"Sound Effects: {'ON' if sound_effects_enabled else 'OFF'}"
-        sound_hover = (button_x <= mouse_x <= button_x + button_width and y_pos <= mouse_y <= y_pos + button_height)
-        sound_btn = draw_button(display, sound_text, button_x, y_pos, button_width, button_height, FONT_MEDIUM, sound_hover)
-        # Description text for Sound Effects
-        render_text_centered(display, "Provides audio feedback for clicks and game events", 
-                           y_pos + 60, FONT_TINY, current_theme['text_secondary'])
-        render_text_centered(display, "to enhance gameplay experience and accessibility", 
-                           y_pos + 75, FONT_TINY, current_theme['text_secondary'])
-        
-        y_pos += 110
-        
-        # Back button
-        back_hover = (button_x <= mouse_x <= button_x + button_width and y_pos <= mouse_y <= y_pos + button_height)
-        back_btn = draw_button(display, "Back to Menu", button_x, y_pos, button_width, button_height, FONT_MEDIUM, back_hover)
-        
-        render_text_centered(display, "Press ESC to return to menu", 
-                           WINDOW_HEIGHT - 30, FONT_TINY, current_theme['text_secondary'])
+        # Handle input before drawing, so a click shows up in this frame.
+        # Once drawn the menu is static, so it sleeps until input arrives
+        if last_frame_state is None:
+            events = poll_events()
+        else:
+            events = wait_for_events(MENU_IDLE_WAIT)
         
-        pygame.display.update()
-        clock.tick(60)
+        # Read the cursor after the wait, for hover highlighting
+        # (clicks are hit-tested where they happened, at event.pos)
+        mouse_x, mouse_y = pygame.mouse.get_pos()
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return
             
+            # Window was uncovered or restored - draw it again
+            if event.type == pygame.VIDEOEXPOSE:
+                last_frame_state = None
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return
             
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if hc_btn.collidepoint(mouse_x, mouse_y):
-                    cycle_theme()
-                    play_sound_effect(sound_click)
-                elif large_btn.collidepoint(mouse_x, mouse_y):
-                    if current_tile_size == TILE_SIZE_EXTRA_LARGE:
-                        current_tile_size = TILE_SIZE_STANDARD
-                        use_large_tiles = False
-                    else:
-                        toggle_large_tiles()
-                    play_sound_effect(sound_click)
-                elif xlarge_btn.collidepoint(mouse_x, mouse_y):
-                    if current_tile_size == TILE_SIZE_EXTRA_LARGE:
-                        current_tile_size = TILE_SIZE_STANDARD
-                        use_large_tiles = False
-                    else:
-                        set_extra_large_tiles(True)
-                        use_large_tiles = True
-                    play_sound_effect(sound_click)
-                elif sound_btn.collidepoint(mouse_x, mouse_y):
-                    sound_effects_enabled = not sound_effects_enabled
-                    play_sound_effect(sound_click)
-                elif back_btn.collidepoint(mouse_x, mouse_y):
+                if back_btn.collidepoint(event.pos):
                     play_sound_effect(sound_click)
                     return
+                
+                # Apply the first toggle button under the click
+                for button_rect, action in button_actions:
+                    if button_rect.collidepoint(event.pos):
+                        action()
+                        play_sound_effect(sound_click)
+                        break
+        
+        # Hover state for each button
+        hc_hover = hc_btn.collidepoint(mouse_x, mouse_y)
+        large_hover = large_btn.collidepoint(mouse_x, mouse_y)
+        xlarge_hover = xlarge_btn.collidepoint(mouse_x, mouse_y)
+        sound_hover = sound_btn.collidepoint(mouse_x, mouse_y)
+        anim_hover = anim_btn.collidepoint(mouse_x, mouse_y)
+        back_hover = back_btn.collidepoint(mouse_x, mouse_y)
+        
+        # Only redraw when the hover state or a setting changed
+        frame_state = (hc_hover, large_hover, xlarge_hover, sound_hover, anim_hover, back_hover,
+                       theme_mode, use_large_tiles, current_tile_size, sound_effects_enabled,
+                       animations_enabled)
+        
+        if frame_state != last_frame_state:
+            # A theme change (or first frame) redraws and pushes the whole
+            # window; otherwise just the buttons' areas are restored
+            full_redraw = last_frame_state is None or backdrop_theme != theme_mode
+            if backdrop_theme != theme_mode:
+                draw_settings_backdrop(backdrop, button_rects)
+                backdrop_theme = theme_mode
+            if full_redraw:
+                display.blit(backdrop, (0, 0))
+            else:
+                display.blits([(backdrop, button_rect, button_rect) for button_rect in button_rects],
+                              doreturn=False)
+            
+            # High Contrast Mode button
+            hc_text = f"High Contrast Mode: {'ON' if theme_mode == 2 else 'OFF'}"
+            draw_button_at(display, hc_text, hc_btn, FONT_MEDIUM, hc_hover)
+            
+            # Large Tiles button
+            large_text = f"Large Tiles: {'ON' if use_large_tiles else 'OFF'}"
+            draw_button_at(display, large_text, large_btn, FONT_MEDIUM, large_hover)
+            
+            # Extra Large Tiles button
+            xlarge_text = f"Extra Large Tiles: {'ON' if current_tile_size == TILE_SIZE_EXTRA_LARGE else 'OFF'}"
+            draw_button_at(display, xlarge_text, xlarge_btn, FONT_MEDIUM, xlarge_hover)
+            
+            # Sound Effects button
+            sound_text = f"Sound Effects: {'ON' if sound_effects_enabled else 'OFF'}"
+            draw_button_at(display, sound_text, sound_btn, FONT_MEDIUM, sound_hover)
+            
+            # Animations button
+            anim_text = f"Animations: {'ON' if animations_enabled else 'OFF'}"
+            draw_button_at(display, anim_text, anim_btn, FONT_MEDIUM, anim_hover)
+            
+            # Back button
+            draw_button_at(display, "Back to Menu", back_btn, FONT_MEDIUM, back_hover)
+            
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(button_rects)
+            last_frame_state = frame_state
 
 def display_start_menu():
     """
@@ -1063,7 +1629,8 @@ def display_start_menu():
     - Keyboard shortcuts
              
     Menu Loop:
-        - Runs at 60 Frames Per Second for smooth animations
+        - Runs at 60 Frames Per Second while the text fades in, then
+          sleeps until input arrives (see wait_for_events())
         - Tracks mouse position for hover effects
         - Processes clicks and keyboard input
         - Re-renders on theme changes
@@ -1074,150 +1641,242 @@ def display_start_menu():
     Returns:
         str: 'play', 'help', or None if quit
     """
-    clock = pygame.time.Clock()
+    clock = frame_clock
     
     # Initial fade-in animation for all text (0.5 seconds)
     fade_duration = 500  # milliseconds
     fade_start_time = pygame.time.get_ticks()
     fade_complete = False
     
+    # Transparent overlay the menu is drawn on while fading in
+    # Allocated once and cleared each frame instead of recreated per frame
+    fade_menu_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+    
+    # Button rectangles never move, so they are built once for hover and click checks
+    button_width, button_height = 280, 50
+    button_x = (WINDOW_WIDTH - button_width) // 2  # Center horizontally
+    play_btn = pygame.Rect(button_x, 400, button_width, button_height)
+    help_btn = pygame.Rect(button_x, 465, button_width, button_height)
+    settings_btn = pygame.Rect(button_x, 530, button_width, button_height)
+    theme_btn = pygame.Rect(button_x, 595, button_width, button_height)
+    button_rects = [play_btn, help_btn, settings_btn, theme_btn]
+    
+    # Hover state and theme of the last drawn frame (None forces a redraw)
+    last_frame_state = None
+    menu_on_screen = False  # True once the fully faded-in menu has been pushed
+    
     # Menu loop - continues until user makes a choice
     while True:
-        # Get current mouse position for hover detection
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        
-        # Draw 3D background (updates animation)
-        display.fill(current_theme['background'])
-        
-        # Calculate fade alpha (0-255) for initial text fade-in
-        if not fade_complete:
-            elapsed = pygame.time.get_ticks() - fade_start_time
-            if elapsed >= fade_duration:
-                fade_alpha = 255
-                fade_complete = True
-            else:
-                fade_alpha = int(255 * (elapsed / fade_duration))
-        else:
-            fade_alpha = 255
-        
-        # ---------------------------------------------------------------------
-        # Title Section
         # ---------------------------------------------------------------------
-        title_surface = FONT_TITLE.render("MonkeyTrain", True, current_theme['text_primary'])
-        if fade_alpha < 255:
-            title_surface.set_alpha(fade_alpha)
-        title_x = (WINDOW_WIDTH - title_surface.get_width()) // 2
-        display.blit(title_surface, (title_x, 65))
-        
-        subtitle_surface = FONT_MEDIUM.render("A Memory Training Game", True, current_theme['text_secondary'])
-        if fade_alpha < 255:
-            subtitle_surface.set_alpha(fade_alpha)
-        subtitle_x = (WINDOW_WIDTH - subtitle_surface.get_width()) // 2
-        display.blit(subtitle_surface, (subtitle_x, 165))
-        
-        # ---------------------------------------------------------------------
-        # Instructions Section
-        # ---------------------------------------------------------------------
-        instructions = [
-            "How to Play:",
-            "1. Watch as numbers appear on the grid",
-            "2. Memorize all number positions",
-            "3. Click tiles in order: (1, 2, 3, ... n)",
-            "4. Complete sequences to level up!"
-        ]
-        
-        # Draw each instruction line
-        y = 210  # Starting Y position
-        for line in instructions:
-            if line:  # Skip empty lines (used for spacing)
-                instruction_surface = FONT_SMALL.render(line, True, current_theme['text_primary'])
-                if fade_alpha < 255:
-                    instruction_surface.set_alpha(fade_alpha)
-                instruction_x = (WINDOW_WIDTH - instruction_surface.get_width()) // 2
-                display.blit(instruction_surface, (instruction_x, y))
-            y += 32  # Vertical spacing between lines
-        
-        # ---------------------------------------------------------------------
-        # Button Section
+        # Event Processing
         # ---------------------------------------------------------------------
-        button_width, button_height = 280, 50
-        button_x = (WINDOW_WIDTH - button_width) // 2  # Center horizontally
-        
-        # Create temporary surface for buttons if fading (to apply alpha)
-        if fade_alpha < 255:
-            button_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        # Handled before drawing, so a click shows up in this frame.
+        # Once faded in the menu is static, so it sleeps until input arrives
+        if menu_on_screen:
+            events = wait_for_events(MENU_IDLE_WAIT)
         else:
-            button_surface = display
-        
-        # Start Game Button
-        play_hover = (button_x <= mouse_x <= button_x + button_width and 
-                     420 <= mouse_y <= 470)
-        play_btn = draw_button(button_surface, "Start Game", button_x, 400, 
-                              button_width, button_height, FONT_MEDIUM, play_hover)
-        
-        # Controls & Help Button
-        help_hover = (button_x <= mouse_x <= button_x + button_width and 
-                     465 <= mouse_y <= 535)
-        help_btn = draw_button(button_surface, "Controls & Help", button_x, 465, 
-                              button_width, button_height, FONT_MEDIUM, help_hover)
-        
-        # Accessibility Settings Button
-        settings_hover = (button_x <= mouse_x <= button_x + button_width and 
-                         530 <= mouse_y <= 600)
-        settings_btn = draw_button(button_surface, "Accessibility Settings", button_x, 530, 
-                                   button_width, button_height, FONT_MEDIUM, settings_hover)
-        
-        # Theme Toggle Button
-        theme_hover = (button_x <= mouse_x <= button_x + button_width and 
-                      595 <= mouse_y <= 665)
-        theme_text = f"Theme: {['Light', 'Dark', 'High Contrast'][theme_mode]}"
-        theme_btn = draw_button(button_surface, theme_text, button_x, 595, 
-                               button_width, button_height, FONT_MEDIUM, theme_hover)
-        
-        # Blit button surface with alpha if fading
-        if fade_alpha < 255:
-            button_surface.set_alpha(fade_alpha)
-            display.blit(button_surface, (0, 0))
+            events = poll_events()
         
-        # ---------------------------------------------------------------------
-        # Footer
-        # ---------------------------------------------------------------------
-        footer_surface = FONT_TINY.render("Press ESC anytime to return to menu", True, 
-                                         current_theme['text_secondary'])
-        if fade_alpha < 255:
-            footer_surface.set_alpha(fade_alpha)
-        footer_x = (WINDOW_WIDTH - footer_surface.get_width()) // 2
-        display.blit(footer_surface, (footer_x, WINDOW_HEIGHT - 30))
-        
-        # Update display
-        pygame.display.update()
-        
-        # Cap frame rate at 60 FPS
-        clock.tick(60)
+        # Get current mouse position for hover detection, after the wait
+        # (clicks are hit-tested where they happened, at event.pos)
+        mouse_x, mouse_y = pygame.mouse.get_pos()
         
-        # ---------------------------------------------------------------------
-        # Event Processing
-        # ---------------------------------------------------------------------
-        for event in pygame.event.get():
+        for event in events:
             # Window close button
             if event.type == pygame.QUIT:
                 return None  # Exit game
             
+            # Window was uncovered or restored - draw it again
+            if event.type == pygame.VIDEOEXPOSE:
+                last_frame_state = None
+            
             # Mouse clicks
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Check if click is on any button using collision detection
-                if play_btn.collidepoint(mouse_x, mouse_y):
+                if play_btn.collidepoint(event.pos):
                     play_sound_effect(sound_click)
                     return 'play'  # Start game
-                elif help_btn.collidepoint(mouse_x, mouse_y):
+                elif help_btn.collidepoint(event.pos):
                     play_sound_effect(sound_click)
                     return 'help'  # Show help screen
-                elif settings_btn.collidepoint(mouse_x, mouse_y):
+                elif settings_btn.collidepoint(event.pos):
                     play_sound_effect(sound_click)
                     display_settings_menu()
-                elif theme_btn.collidepoint(mouse_x, mouse_y):
+                    last_frame_state = None  # Settings menu drew over the screen
+                elif theme_btn.collidepoint(event.pos):
                     cycle_theme()
                     play_sound_effect(sound_click)
+        
+        # Hover state for each button
+        play_hover = play_btn.collidepoint(mouse_x, mouse_y)
+        help_hover = help_btn.collidepoint(mouse_x, mouse_y)
+        settings_hover = settings_btn.collidepoint(mouse_x, mouse_y)
+        theme_hover = theme_btn.collidepoint(mouse_x, mouse_y)
+        
+        # The menu is static once faded in - only redraw when a hover
+        # state or the theme changed since the last drawn frame
+        frame_state = (play_hover, help_hover, settings_hover, theme_hover, theme_mode)
+        needs_redraw = not fade_complete or frame_state != last_frame_state
+        
+        if needs_redraw:
+            # Draw 3D background (updates animation)
+            display.fill(current_theme['background'])
+            
+            # Calculate fade alpha (0-255) for initial text fade-in
+            if not fade_complete:
+                elapsed = pygame.time.get_ticks() - fade_start_time
+                if elapsed >= fade_duration:
+                    fade_alpha = 255
+                    fade_complete = True
+                else:
+                    fade_alpha = int(255 * (elapsed / fade_duration))
+            else:
+                fade_alpha = 255
+            
+            # While fading, everything is drawn on the shared overlay so one
+            # alpha applies to the whole menu; the cached text surfaces
+            # themselves are never given an alpha
+            if fade_alpha < 255:
+                menu_surface = fade_menu_surface
+                menu_surface.fill((0, 0, 0, 0))
+            else:
+                menu_surface = display
+            
+            # -----------------------------------------------------------------
+            # Title Section
+            # -----------------------------------------------------------------
+            render_text_centered(menu_surface, "MonkeyTrain", 65, FONT_TITLE,
+                                 current_theme['text_primary'])
+            render_text_centered(menu_surface, "A Memory Training Game", 165, FONT_MEDIUM,
+                                 current_theme['text_secondary'])
+            
+            # -----------------------------------------------------------------
+            # Instructions Section
+            # -----------------------------------------------------------------
+            instructions = [
+                "How to Play:",
+                "1. Watch as numbers appear on the grid",
+                "2. Memorize all number positions",
+                "3. Click tiles in order: (1, 2, 3, ... n)",
+                "4. Complete sequences to level up!"
+            ]
+            
+            # Draw each instruction line
+            y = 210  # Starting Y position
+            for line in instructions:
+                if line:  # Skip empty lines (used for spacing)
+                    render_text_centered(menu_surface, line, y, FONT_SMALL,
+                                         current_theme['text_primary'])
+                y += 32  # Vertical spacing between lines
+            
+            # -----------------------------------------------------------------
+            # Button Section
+            # -----------------------------------------------------------------
+            # Start Game Button
+            draw_button_at(menu_surface, "Start Game", play_btn, FONT_MEDIUM, play_hover)
+            
+            # Controls & Help Button
+            draw_button_at(menu_surface, "Controls & Help", help_btn, FONT_MEDIUM, help_hover)
+            
+            # Accessibility Settings Button
+            draw_button_at(menu_surface, "Accessibility Settings", settings_btn, FONT_MEDIUM,
+                           settings_hover)
+            
+            # Theme Toggle Button
+            theme_text = f"Theme: {['Light', 'Dark', 'High Contrast'][theme_mode]}"
+            draw_button_at(menu_surface, theme_text, theme_btn, FONT_MEDIUM, theme_hover)
+            
+            # -----------------------------------------------------------------
+            # Footer
+            # -----------------------------------------------------------------
+            render_text_centered(menu_surface, "Press ESC anytime to return to menu",
+                                 WINDOW_HEIGHT - 30, FONT_TINY, current_theme['text_secondary'])
+            
+            # Blit the menu overlay with alpha if fading
+            if fade_alpha < 255:
+                menu_surface.set_alpha(fade_alpha)
+                display.blit(menu_surface, (0, 0))
+            
+            # Update display
+            # Once the faded-in menu is showing, a hover change in the same
+            # theme only alters the buttons, so only they are pushed
+            if (menu_on_screen and last_frame_state is not None
+                    and last_frame_state[4] == theme_mode):
+                pygame.display.update(button_rects)
+            else:
+                pygame.display.flip()
+            menu_on_screen = fade_complete
+            last_frame_state = frame_state
+        
+        # Cap frame rate at 60 FPS while the menu fades in
+        if not menu_on_screen:
+            clock.tick(60)
+
+# Help screen content, top to bottom, tagged with how each line is drawn:
+# 'header' lines are section titles, 'text' lines are content and 'gap'
+# entries only add vertical space
+HELP_LINES = (
+    ('gap', None),
+    ('header', 'Keyboard Controls:'),
+    ('text', 'ESC - Return to menu / Pause game'),
+    ('text', 'D - Cycle through themes (Light/Dark/High Contrast)'),
+    ('text', 'S - Open accessibility settings'),
+    ('gap', None),
+    ('gap', None),
+    ('header', 'Difficulty Progression:'),
+    ('text', 'Score 0-2: 3×3 grid, 10.3 seconds'),
+    ('text', 'Score 3-6: 4×4 grid, 10.0 seconds'),
+    ('text', 'Score 7-11: 5×5 grid, 9.8 seconds'),
+    ('text', 'Score 12+: 5×5 grid, 9.5 seconds'),
+    ('gap', None),
+    ('gap', None),
+    ('header', 'Pro Tips:'),
+    ('text', '• Focus on spatial patterns, not just numbers'),
+    ('text', '• Group numbers mentally (corners, edges, center)'),
+    ('text', '• Take short breaks to maintain focus!'),
+    ('gap', None),
+)
+
+def draw_help_backdrop(surface):
+    """
+    Draw everything on the help screen except the back button.
+    
+    display_help_screen() draws this onto an off-screen surface once and
+    only redraws the back button over it when its hover state changes.
+    
+    Functions:
+        surface (pygame.Surface): Window-sized surface to draw on
+        
+    Returns:
+        None
+    """
+    surface.fill(current_theme['background'])
+    
+    # -------------------------------------------------------------------------
+    # Title
+    # -------------------------------------------------------------------------
+    render_text_centered(surface, "Controls & Help", 40, FONT_TITLE,
+                         current_theme['text_primary'])
+    
+    # -------------------------------------------------------------------------
+    # Help Content
+    # -------------------------------------------------------------------------
+    # Draw each line with appropriate formatting
+    y = 130  # Starting Y position
+    for kind, line in HELP_LINES:
+        # Section headers (colored differently for emphasis)
+        if kind == 'header':
+            render_text_centered(surface, line, y, FONT_MEDIUM,
+                                 current_theme['success'])
+            y += 35  # Extra spacing after headers
+        # Content lines
+        elif kind == 'text':
+            render_text_centered(surface, line, y, FONT_SMALL,
+                                 current_theme['text_primary'])
+            y += 28  # Normal line spacing
+        # Empty lines (spacing only)
+        else:
+            y += 15  # Smaller spacing for empty lines
 
 def display_help_screen():
     """
@@ -1239,95 +1898,47 @@ def display_help_screen():
     Layout:
         Content is organized into labeled sections with consistent spacing
     """
-    clock = pygame.time.Clock()
+    # The back button never moves, so its rectangle is built once
+    button_width, button_height = 280, 50
+    button_x = (WINDOW_WIDTH - button_width) // 2
+    back_btn = pygame.Rect(button_x, WINDOW_HEIGHT - 90, button_width, button_height)
+    
+    # The help text can't change while this screen is open (there is no
+    # theme key here), so it is rendered once onto an off-screen surface
+    help_backdrop = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    draw_help_backdrop(help_backdrop)
+    
+    # Hover state of the last drawn frame (None forces a redraw)
+    last_frame_state = None
     
     # Help screen loop
     while True:
-        # Get mouse position for button hover detection
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        
-        # Draw 3D background (updates animation)
-        display.fill(current_theme['background'])
-        
-        # ---------------------------------------------------------------------
-        # Title
         # ---------------------------------------------------------------------
-        render_text_centered(display, "Controls & Help", 40, FONT_TITLE, 
-                           current_theme['text_primary'])
-        
-        # ---------------------------------------------------------------------
-        # Help Content
-        # ---------------------------------------------------------------------
-        help_lines = [
-            "",  # Spacing
-            "Keyboard Controls:",
-            "ESC - Return to menu / Pause game",
-            "D - Cycle through themes (Light/Dark/High Contrast)",
-            "S - Open accessibility settings",
-            "",
-            "",
-            "Difficulty Progression:",
-            "Score 0-2: 3×3 grid, 10.3 seconds",
-            "Score 3-6: 4×4 grid, 10.0 seconds",
-            "Score 7-11: 5×5 grid, 9.8 seconds",
-            "Score 12+: 5×5 grid, 9.5 seconds",
-            "",
-            "",
-            "Pro Tips:",
-            "• Focus on spatial patterns, not just numbers",
-            "• Group numbers mentally (corners, edges, center)",
-            "• Take short breaks to maintain focus!",
-            ""
-        ]
-        
-        # Draw each line with appropriate formatting
-        y = 130  # Starting Y position
-        for line in help_lines:
-            # Section headers (colored differently for emphasis)
-            if line.startswith(("Keyboard", "Difficulty", "Pro")):
-                render_text_centered(display, line, y, FONT_MEDIUM, 
-                                   current_theme['success'])
-                y += 35  # Extra spacing after headers
-            # Content lines
-            elif line:
-                render_text_centered(display, line, y, FONT_SMALL, 
-                                   current_theme['text_primary'])
-                y += 28  # Normal line spacing
-            # Empty lines (spacing only)
-            else:
-                y += 15  # Smaller spacing for empty lines
-        
-        # ---------------------------------------------------------------------
-        # Back Button
+        # Event Processing
         # ---------------------------------------------------------------------
-        button_width, button_height = 280, 50
-        button_x = (WINDOW_WIDTH - button_width) // 2
-        
-        # Check if mouse is hovering over button
-        back_hover = (button_x <= mouse_x <= button_x + button_width and 
-                     WINDOW_HEIGHT - 90 <= mouse_y <= WINDOW_HEIGHT - 40)
-        
-        back_btn = draw_button(display, "Back to Menu", button_x, 
-                              WINDOW_HEIGHT - 90, button_width, button_height, 
-                              FONT_MEDIUM, back_hover)
-        
-        # Update display
-        pygame.display.update()
+        # Handled before drawing, so a click shows up in this frame.
+        # Once drawn the screen is static, so it sleeps until input arrives
+        if last_frame_state is None:
+            events = poll_events()
+        else:
+            events = wait_for_events(MENU_IDLE_WAIT)
         
-        # Cap frame rate
-        clock.tick(60)
+        # Get mouse position for button hover detection, after the wait
+        # (clicks are hit-tested where they happened, at event.pos)
+        mouse_x, mouse_y = pygame.mouse.get_pos()
         
-        # ---------------------------------------------------------------------
-        # Event Processing
-        # ---------------------------------------------------------------------
-        for event in pygame.event.get():
+        for event in events:
             # Window close
             if event.type == pygame.QUIT:
                 return  # Exit to main menu (which will then exit game)
             
+            # Window was uncovered or restored - draw it again
+            if event.type == pygame.VIDEOEXPOSE:
+                last_frame_state = None
+            
             # Mouse clicks
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if back_btn.collidepoint(mouse_x, mouse_y):
+                if back_btn.collidepoint(event.pos):
                     play_sound_effect(sound_click)
                     return  # Return to main menu
             
@@ -1335,6 +1946,38 @@ def display_help_screen():
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return  # ESC also returns to menu
+        
+        # Check if mouse is hovering over button
+        back_hover = back_btn.collidepoint(mouse_x, mouse_y)
+        
+        # The help screen is static - only redraw when the hover state changed
+        frame_state = back_hover
+        needs_redraw = frame_state != last_frame_state
+        
+        if needs_redraw:
+            # -----------------------------------------------------------------
+            # Background, Title and Help Content
+            # -----------------------------------------------------------------
+            # The whole backdrop on the first frame, afterwards just the area
+            # under the back button
+            if last_frame_state is None:
+                display.blit(help_backdrop, (0, 0))
+            else:
+                display.blit(help_backdrop, back_btn, back_btn)
+            
+            # -----------------------------------------------------------------
+            # Back Button
+            # -----------------------------------------------------------------
+            draw_button_at(display, "Back to Menu", back_btn, FONT_MEDIUM, back_hover)
+            
+            # Update display
+            # Only the back button can change once the screen is showing,
+            # so a hover change pushes just its rectangle
+            if last_frame_state is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(back_btn)
+            last_frame_state = frame_state
 
 def show_round_feedback(success, score, grid_size):
     """
@@ -1354,15 +1997,18 @@ def show_round_feedback(success, score, grid_size):
         N
         
     Display Duration:
-        Automatically closes after 2.0 seconds
+        Automatically closes after FEEDBACK_DURATION milliseconds; any key
+        press or mouse click made while it is showing skips the rest of
+        the wait
         
     Visual Design:
         - Success: Green "Correct!" message
         - Failure: Red "Wrong!" message with encouragement
         - Shows next challenge preview for planning
     """
-    # Smooth fade transition
-    fade_transition(400)
+    # Smooth fade transition (skipped when animations are turned off)
+    if animations_enabled:
+        fade_transition(400)
     
     # Draw background
     display.fill(current_theme['background'])
@@ -1376,7 +2022,7 @@ def show_round_feedback(success, score, grid_size):
                            FONT_TITLE, current_theme['success'])
         render_text_centered(display, f"You completed the {grid_size}×{grid_size} grid!", 
                            WINDOW_HEIGHT // 2 - 20, FONT_MEDIUM, 
-                           current_theme['text_primary'])
+                           current_theme['text_primary'], cache=False)
     else:
         # Failure message in red with encouragement
         render_text_centered(display, "Wrong!", WINDOW_HEIGHT // 2 - 80, 
@@ -1388,20 +2034,36 @@ def show_round_feedback(success, score, grid_size):
     # Score Display
     render_text_centered(display, f"Current Score: {score}", 
                        WINDOW_HEIGHT // 2 + 30, FONT_LARGE, 
-                       current_theme['text_primary'])
+                       current_theme['text_primary'], cache=False)
     
     # Calculate what the next round will be like
     next_size, next_time = get_difficulty_settings(score)
     render_text_centered(display, 
                        f"Next Challenge: {next_size}×{next_size} grid, {next_time:.1f}s", 
                        WINDOW_HEIGHT // 2 + 80, FONT_SMALL, 
-                       current_theme['text_secondary'])
+                       current_theme['text_secondary'], cache=False)
     
     # Update display to show all elements
     pygame.display.update()
     
-    # Hold screen for 2.0 seconds before continuing
-    time.sleep(2.0)
+    # Hold the screen before continuing, still servicing the event queue so
+    # the window stays responsive and the player can skip ahead
+    # Input left over from the round or the fade (the fades pump SDL but
+    # don't read the queue) mustn't skip a screen the player hasn't seen
+    pygame.event.clear((pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN))
+    clock = frame_clock
+    start_time = pygame.time.get_ticks()
+    while pygame.time.get_ticks() - start_time < FEEDBACK_DURATION:
+        for event in poll_events():
+            if event.type == pygame.QUIT:
+                # Put it back so the next round's event loop handles it
+                pygame.event.post(event)
+                return
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                return
+            if event.type == pygame.VIDEOEXPOSE:
+                pygame.display.update()
+        clock.tick(30)
 
 # =============================================================================
 # MAIN GAME LOOP
@@ -1488,11 +2150,9 @@ def main():
     """
     global music_channel, background_music
     
-    clock = pygame.time.Clock()
-    
     # Initial fade-in when game starts
     display.fill(current_theme['background'])
-    pygame.display.update()
+    pygame.display.flip()
     fade_in_screen()
     
     # Main menu loop